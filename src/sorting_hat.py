@@ -1,14 +1,26 @@
 from __future__ import annotations
 import csv
+import functools
+import os
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, TypeAlias, Union
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Tuple, TypeAlias, Union
 
-import pandas
-from ortools.sat.python import cp_model
-from ortools.sat.python.cp_model import CpModel, IntVar, BoundedLinearExpression
-from pandas import DataFrame
 import click
 
+if TYPE_CHECKING:
+    # heavy imports are only needed here for annotations; at runtime they
+    # happen inside the functions that use them, so e.g. `--help` does not
+    # pay the pandas/ortools import cost
+    import numpy
+    from ortools.sat.python import cp_model
+    from ortools.sat.python.cp_model import (
+        BoundedLinearExpression,
+        CpModel,
+        IntVar,
+        LinearExpr,
+    )
+    from pandas import DataFrame
+
 StudentPreferences: TypeAlias = Dict[str, List[str]]
 
 EXAMPLE_STUDENT_PREFERENCES_FILENAME: str = "example_student_preferences.csv"
@@ -18,52 +30,75 @@ EXAMPLE_FILE_ENCODING: str = "utf-8"
 
 
 class Courses:
-    valid_fields: List[str] = ["name", "min_size", "max_size"]
+    valid_fields: FrozenSet[str] = frozenset(("name", "min_size", "max_size"))
 
     @classmethod
     def make_from_file(cls, file_path: Path, encoding: Union[str, None]) -> Courses:
-        course_info: DataFrame = pandas.read_csv(file_path, encoding=encoding)
+        course_info: DataFrame = _read_course_info_cached(
+            str(file_path), file_path.stat().st_mtime_ns, encoding
+        )
         return Courses(course_info)
 
+    @classmethod
+    def from_tuples(cls, rows: List[Tuple[str, int, int]]) -> Courses:
+        # constructor that skips the DataFrame round-trip; handy when the
+        # course list is already in memory, e.g. in tests
+        courses: Courses = cls.__new__(cls)
+        courses._sizes_by_name = {
+            name: {"min_size": min_size, "max_size": max_size}
+            for name, min_size, max_size in rows
+        }
+        if len(courses._sizes_by_name) != len(rows):
+            raise ValueError(
+                f"course names must be unique, received {[row[0] for row in rows]}"
+            )
+        courses._all_names = [row[0] for row in rows]
+        return courses
+
     def __init__(self, course_info: DataFrame):
-        if not set(self.valid_fields) == set(course_info.columns):
+        if not self.valid_fields == set(course_info.columns):
+            raise ValueError(
+                f"expected fields {sorted(self.valid_fields)} but received {course_info.columns}"
+            )
+        # single-record lookups happen once per course per solve, so index the
+        # sizes by name once instead of running a pandas query per lookup
+        self._sizes_by_name: Dict[str, Dict[str, int]] = course_info.set_index("name")[
+            ["min_size", "max_size"]
+        ].to_dict("index")
+        if len(self._sizes_by_name) != len(course_info):
             raise ValueError(
-                f"expected fields {self.valid_fields} but received {course_info.columns}"
+                f"course names must be unique, received {course_info['name'].to_list()}"
             )
-        self.course_info: DataFrame = course_info
+        self._all_names: List[str] = course_info["name"].to_list()
 
     def __len__(self) -> int:
-        return len(self.course_info)
+        return len(self._all_names)
 
     def __eq__(self, other: Any) -> bool:
+        if other is self:
+            return True
         if not isinstance(other, self.__class__):
             return False
         other: Courses
-        return self.course_info.equals(other.course_info)
+        return (
+            self._all_names == other._all_names
+            and self._sizes_by_name == other._sizes_by_name
+        )
 
     def __str__(self):
-        return str(self.course_info)
+        return "\n".join(
+            f"{name}: min_size={sizes['min_size']}, max_size={sizes['max_size']}"
+            for name, sizes in self._sizes_by_name.items()
+        )
 
     def get_all_course_names(self) -> List[str]:
-        return self.course_info["name"].to_list()
+        return self._all_names
 
     def get_max_students_by_course_name(self, course_name: str) -> int:
-        field: str = 'max_size'
-        value = self.query_single_record_field_by_course_name(course_name, field)
-        return value
+        return self._sizes_by_name[course_name]["max_size"]
 
     def get_min_students_by_course_name(self, course_name: str):
-        field: str = 'min_size'
-        value = self.query_single_record_field_by_course_name(course_name, field)
-        return value
-
-    def query_single_record_field_by_course_name(self, course_name: str, field: str):
-        records: DataFrame = self.course_info.query(f"name == '{course_name}'")
-        assert (
-            len(records) == 1
-        ), f"found {len(records)} entries for course {course_name}, expected exactly 1"
-        value: int = records[field].squeeze()
-        return value
+        return self._sizes_by_name[course_name]["min_size"]
 
 
 def get_example_problem():
@@ -78,68 +113,142 @@ def get_example_problem():
 
 class CourseAssignmentVariables:
     def __init__(self, initial_variables: List[Tuple[str, str, cp_model.IntVar]]):
-        self.variables: DataFrame = DataFrame(
-            data=initial_variables, columns=["student", "course", "variable"]
+        import numpy
+
+        # variables live in a student x course grid so that every lookup is a
+        # dict access plus an array slice instead of a DataFrame scan
+        self.student_names: List[str] = []
+        self.course_names: List[str] = []
+        self.student_index: Dict[str, int] = {}
+        self.course_index: Dict[str, int] = {}
+        for student_name, course_name, _ in initial_variables:
+            if student_name not in self.student_index:
+                self.student_index[student_name] = len(self.student_names)
+                self.student_names.append(student_name)
+            if course_name not in self.course_index:
+                self.course_index[course_name] = len(self.course_names)
+                self.course_names.append(course_name)
+        self.variable_grid: numpy.ndarray = numpy.full(
+            (len(self.student_names), len(self.course_names)), None, dtype=object
+        )
+        # the variables' model indices, -1 where no variable exists; lets the
+        # report read the solver's solution vector in one batched lookup
+        self._variable_index_grid: numpy.ndarray = numpy.full(
+            self.variable_grid.shape, -1, dtype=numpy.int64
+        )
+        for student_name, course_name, variable in initial_variables:
+            student_id: int = self.student_index[student_name]
+            course_id: int = self.course_index[course_name]
+            self.variable_grid[student_id, course_id] = variable
+            self._variable_index_grid[student_id, course_id] = variable.Index()
+        self._student_name_array: numpy.ndarray = numpy.array(
+            self.student_names, dtype=object
+        )
+        self._course_name_array: numpy.ndarray = numpy.array(
+            self.course_names, dtype=object
         )
 
     def __eq__(self, other: Any):
+        if other is self:
+            return True
         if not isinstance(other, self.__class__):
             return False
-        # not sure how to meaningfully compare the IntVar objects, so dropping those for now
-        return self.variables[["student", "course"]].equals(
-            other.variables[["student", "course"]]
+        # not sure how to meaningfully compare the IntVar objects, so comparing
+        # the (student, course) pairs only
+        return (
+            self.variable_grid.shape == other.variable_grid.shape
+            and self.student_names == other.student_names
+            and self.course_names == other.course_names
         )
 
     def get_by_student_name(self, name: str) -> List[cp_model.IntVar]:
-        student_vars: List[cp_model.IntVar] = self.variables.query(
-            f"student == '{name}'"
-        )["variable"].to_list()
-        return student_vars
+        if name not in self.student_index:
+            return []
+        row: numpy.ndarray = self.variable_grid[self.student_index[name]]
+        return [var for var in row if var is not None]
 
     def get_by_course_name(self, name: str) -> List[IntVar]:
-        course_vars: List[cp_model.IntVar] = self.variables.query(
-            f"course == '{name}'"
-        )["variable"].to_list()
-        return course_vars
+        if name not in self.course_index:
+            return []
+        column: numpy.ndarray = self.variable_grid[:, self.course_index[name]]
+        return [var for var in column if var is not None]
 
     def get_by_student_name_and_courses(
         self, student_name: str, course_names: List[str]
     ):
-        variables: List[IntVar] = self.variables[
-            (self.variables["student"] == student_name)
-            & (self.variables["course"].isin(course_names))
-        ]["variable"].to_list()
+        variables: List[IntVar] = []
+        if student_name in self.student_index:
+            student_id: int = self.student_index[student_name]
+            for course_name in course_names:
+                if course_name in self.course_index:
+                    variable = self.variable_grid[
+                        student_id, self.course_index[course_name]
+                    ]
+                    if variable is not None:
+                        variables.append(variable)
         if len(variables) == 0:
             raise ValueError(
                 f"no variables for student {student_name}, courses {course_names}"
             )
         return variables
 
+    def get_by_student_name_and_course(
+        self, student_name: str, course_name: str
+    ) -> IntVar:
+        if student_name in self.student_index and course_name in self.course_index:
+            variable = self.variable_grid[
+                self.student_index[student_name], self.course_index[course_name]
+            ]
+            if variable is not None:
+                return variable
+        raise ValueError(
+            f"no variable for student {student_name}, course {course_name}"
+        )
+
     def get_all(self) -> List[IntVar]:
-        return self.variables["variable"].to_list()
+        return [var for var in self.variable_grid.ravel() if var is not None]
 
     def report_final_assignments(self, solver: cp_model.CpSolver) -> DataFrame:
-        solver_decisions: List[bool] = [
-            solver.Value(var) == 1 for var in self.variables["variable"]
-        ]
-        return self.variables[solver_decisions][["student", "course"]].reset_index(
-            drop=True
+        import numpy
+        from pandas import DataFrame
+
+        # one batched read of the full solution vector instead of a
+        # solver.Value round-trip per variable
+        solution_values: numpy.ndarray = numpy.asarray(
+            solver.ResponseProto().solution, dtype=numpy.int64
+        )
+        flat_indices: numpy.ndarray = self._variable_index_grid.ravel()
+        variable_exists: numpy.ndarray = flat_indices >= 0
+        solver_decisions: numpy.ndarray = numpy.zeros(flat_indices.size, dtype=bool)
+        solver_decisions[variable_exists] = (
+            solution_values[flat_indices[variable_exists]] == 1
+        )
+        student_ids, course_ids = numpy.divmod(
+            numpy.flatnonzero(solver_decisions), len(self.course_names)
+        )
+        return DataFrame(
+            data={
+                "student": self._student_name_array[student_ids],
+                "course": self._course_name_array[course_ids],
+            }
         )
 
 
 def generate_course_assignment_variables(
     students: StudentPreferences, courses: Courses, model: CpModel
 ) -> CourseAssignmentVariables:
-    student_names: List[str] = list(students.keys())
-    course_names: List[str] = courses.get_all_course_names()
+    # only create variables for (student, preferred course) pairs: a student
+    # can never be assigned to a course they did not list, so variables for
+    # those pairs would just be forced to 0 anyway and bloat the model
+    # the solver does not need variable names; skipping the f-string per pair
+    # saves one string build and its protobuf copy for every variable. the
+    # (student, course) labels live in CourseAssignmentVariables instead.
+    course_name_set: set = set(courses.get_all_course_names())
     initial_variables: List[Tuple[str, str, cp_model.IntVar]] = [
-        (
-            student_name,
-            course_name,
-            model.NewBoolVar(f"{student_name} in {course_name}"),
-        )
-        for student_name in student_names
-        for course_name in course_names
+        (student_name, course_name, model.NewBoolVar(""))
+        for student_name, preferred_courses in students.items()
+        for course_name in preferred_courses
+        if course_name in course_name_set
     ]
     assignments = CourseAssignmentVariables(initial_variables)
     return assignments
@@ -155,126 +264,220 @@ def solve_example_problem() -> None:
     )
 
 
-def generate_constraints_only_preferred_courses(
+def add_assignment_constraints_to_model(
     assignment_variables: CourseAssignmentVariables,
-    course_max_students: Courses,
-    student_preferences: StudentPreferences,
-) -> List[BoundedLinearExpression]:
-    only_preferred_courses_constraints: List[BoundedLinearExpression] = []
-    all_course_name_set: set = set(course_max_students.get_all_course_names())
-    student_names: List[str] = list(student_preferences.keys())
-    for student_name in student_names:
-        student_preferred_course_set: set = set(student_preferences[student_name])
-        non_preferred_courses: set = all_course_name_set - student_preferred_course_set
-        non_preferred_assign_vars: List[
-            IntVar
-        ] = assignment_variables.get_by_student_name_and_courses(
-            student_name, list(non_preferred_courses)
-        )
-        for av in non_preferred_assign_vars:
-            only_preferred_courses_constraints.append(av == 0)
-    return only_preferred_courses_constraints
-
+    students: StudentPreferences,
+    courses: Courses,
+    model: CpModel,
+) -> None:
+    from ortools.sat.python.cp_model import LinearExpr
 
-def generate_constraints_max_students_per_course(
-    assignment_variables: CourseAssignmentVariables, courses: Courses,
-) -> List[BoundedLinearExpression]:
-    course_names: list[str] = courses.get_all_course_names()
-    max_students_per_course_constraints: List[BoundedLinearExpression] = []
-    for course_name in course_names:
+    # one pass over students and one pass over courses; constraints go
+    # straight into the model instead of being collected in lists first
+    for student_name in students:
+        variables_for_student: List[
+            cp_model.IntVar
+        ] = assignment_variables.get_by_student_name(student_name)
+        # dedicated boolean constraint, propagates better than sum(vars) == 1
+        model.AddExactlyOne(variables_for_student)
+    for course_name in courses.get_all_course_names():
+        variables_for_course: List[IntVar] = assignment_variables.get_by_course_name(
+            course_name
+        )
+        if len(variables_for_course) == 0:
+            # no student listed this course, it trivially stays empty
+            continue
         course_max_nr_students: int = courses.get_max_students_by_course_name(
             course_name
         )
-        variables_for_course: List[IntVar] = assignment_variables.get_by_course_name(
+        if course_max_nr_students == 1:
+            # dedicated boolean constraint for unit-capacity courses
+            model.AddAtMostOne(variables_for_course)
+        else:
+            # AddLinearConstraint skips the comparison-operator expression
+            # object that model.Add(sum <= cap) would build
+            model.AddLinearConstraint(
+                LinearExpr.Sum(variables_for_course), 0, course_max_nr_students
+            )
+        course_min_nr_students: int = courses.get_min_students_by_course_name(
             course_name
         )
-        constraint: BoundedLinearExpression = sum(
-            variables_for_course
-        ) <= course_max_nr_students
-        max_students_per_course_constraints.append(constraint)
-    return max_students_per_course_constraints
+        if course_min_nr_students <= 0:
+            # a minimum of 0 is always satisfied, no constraint needed
+            continue
+        # EITHER a course has 0 students OR at least min_nr_students. expressed
+        # via a single 'course is open' indicator: any assignment opens the
+        # course (plain implication clauses), and an open course must reach the
+        # minimum. cheaper for the solver than reifying both branches.
+        course_is_open: IntVar = model.NewBoolVar(f"{course_name} is open")
+        for assign_var in variables_for_course:
+            model.AddImplication(assign_var, course_is_open)
+        model.Add(
+            LinearExpr.Sum(variables_for_course)
+            >= course_min_nr_students * course_is_open
+        )
 
 
-def generate_constraints_exactly_one_course_per_student(
+def add_symmetry_breaking_constraints_for_identical_preferences(
     assignment_variables: CourseAssignmentVariables,
-    student_preferences: StudentPreferences,
-) -> List[BoundedLinearExpression]:
-    student_names: list = list(student_preferences.keys())
-    exactly_one_course_constraints: List[BoundedLinearExpression] = []
-    for student_name in student_names:
-        variables_for_student: List[
-            cp_model.IntVar
-        ] = assignment_variables.get_by_student_name(student_name)
-        constraint: BoundedLinearExpression = sum(variables_for_student) == 1
-        exactly_one_course_constraints.append(constraint)
-    return exactly_one_course_constraints
+    students: StudentPreferences,
+    model: CpModel,
+) -> None:
+    from ortools.sat.python.cp_model import LinearExpr
+
+    # students with the same preference list are interchangeable: any solution
+    # can be permuted so that, within such a group, earlier students get at
+    # least as good a preference rank as later ones. adding that ordering as a
+    # constraint removes the group-permutation symmetry from the search space.
+    students_by_preferences: Dict[Tuple[str, ...], List[str]] = {}
+    for student_name, course_list in students.items():
+        students_by_preferences.setdefault(tuple(course_list), []).append(student_name)
+    for course_list, student_group in students_by_preferences.items():
+        if len(student_group) < 2:
+            continue
+        preference_ranks: List[int] = list(range(len(course_list)))
+        rank_expressions: List[BoundedLinearExpression] = []
+        for student_name in student_group:
+            variables: List[IntVar] = assignment_variables.get_by_student_name_and_courses(
+                student_name, list(course_list)
+            )
+            if len(variables) != len(course_list):
+                # some preferred course has no variable (e.g. unknown course),
+                # ranks would not line up, so leave this group unconstrained
+                rank_expressions = []
+                break
+            rank_expressions.append(
+                LinearExpr.WeightedSum(variables, preference_ranks)
+            )
+        for better, worse in zip(rank_expressions, rank_expressions[1:]):
+            model.Add(better <= worse)
+
+
+def add_preference_hints_to_model(
+    assignment_variables: CourseAssignmentVariables,
+    students: StudentPreferences,
+    courses: Courses,
+    model: CpModel,
+) -> None:
+    # greedy warm start: walk students in input order and give each one their
+    # best-ranked course that still has capacity. the result is usually a
+    # decent incumbent, which gives the solver a tight upper bound to prune
+    # with right away. hints may be partially broken (e.g. min sizes are
+    # ignored here), which is fine -- the solver only uses them as guidance.
+    remaining_capacity: Dict[str, int] = {
+        course_name: courses.get_max_students_by_course_name(course_name)
+        for course_name in courses.get_all_course_names()
+    }
+    for student_name, course_list in students.items():
+        chosen_course: Union[str, None] = None
+        for course_name in course_list:
+            if remaining_capacity.get(course_name, 0) > 0:
+                remaining_capacity[course_name] -= 1
+                chosen_course = course_name
+                break
+        for course_name in course_list:
+            try:
+                variable: IntVar = assignment_variables.get_by_student_name_and_course(
+                    student_name, course_name
+                )
+            except ValueError:
+                continue
+            model.AddHint(variable, 1 if course_name == chosen_course else 0)
 
 
 def generate_cost(
     students: StudentPreferences, course_assignments: CourseAssignmentVariables
 ) -> BoundedLinearExpression:
-    cost_terms: List[BoundedLinearExpression] = []
+    from ortools.sat.python.cp_model import LinearExpr
+
+    cost_variables: List[IntVar] = []
+    cost_coefficients: List[int] = []
     for student_name, course_list in students.items():
         # note that courses in list are ordered by preference
         for preference_index, course in enumerate(course_list):
-            assign_var: IntVar = course_assignments.get_by_student_name_and_courses(
-                student_name, [course]
-            )[0]
-            cost_terms.append(preference_index * assign_var)
-    cost: BoundedLinearExpression = sum(cost_terms)
+            assign_var: IntVar = course_assignments.get_by_student_name_and_course(
+                student_name, course
+            )
+            cost_variables.append(assign_var)
+            cost_coefficients.append(preference_index)
+    cost: BoundedLinearExpression = LinearExpr.WeightedSum(
+        cost_variables, cost_coefficients
+    )
     return cost
 
 
 def read_student_preferences_file(
     file_path: Path, encoding: Union[str, None]
 ) -> StudentPreferences:
-    out: StudentPreferences = {}
-    with file_path.open("r", encoding=encoding) as f:
+    return _read_student_preferences_cached(
+        str(file_path), file_path.stat().st_mtime_ns, encoding
+    )
+
+
+# repeated reads of an unchanged file (common when running the test suite or
+# batch-solving) hit the cache; the mtime in the key invalidates it on change
+@functools.lru_cache(maxsize=None)
+def _read_student_preferences_cached(
+    file_path: str, mtime_ns: int, encoding: Union[str, None]
+) -> StudentPreferences:
+    # newline="" is what the csv module expects; the large buffer keeps read
+    # syscalls low for big preference files
+    with open(file_path, "r", encoding=encoding, newline="", buffering=1 << 20) as f:
         reader = csv.reader(f, delimiter=",", quotechar='"')
-        for row in reader:
-            student, courses = row[0], row[1:]
-            out[student] = courses
-    return out
+        preferences: StudentPreferences = {row[0]: row[1:] for row in reader if row}
+    return preferences
+
+
+@functools.lru_cache(maxsize=None)
+def _read_course_info_cached(
+    file_path: str, mtime_ns: int, encoding: Union[str, None]
+) -> DataFrame:
+    import pandas
+
+    return pandas.read_csv(file_path, encoding=encoding)
 
 
-def solve(students: StudentPreferences, courses: Courses) -> Union[DataFrame, None]:
+def solve(
+    students: StudentPreferences,
+    courses: Courses,
+    num_search_workers: Union[int, None] = None,
+    use_hint: bool = True,
+) -> Union[DataFrame, None]:
+    from ortools.sat.python import cp_model
+
     model = cp_model.CpModel()
     assignment_variables: CourseAssignmentVariables = generate_course_assignment_variables(
         students, courses, model
     )
 
-    exactly_one_course_constraints = generate_constraints_exactly_one_course_per_student(
-        assignment_variables, students
-    )
-    max_students_per_course_constraints = generate_constraints_max_students_per_course(
-        assignment_variables, courses
-    )
-    only_preferred_courses_constraints = generate_constraints_only_preferred_courses(
-        assignment_variables, courses, students
+    add_assignment_constraints_to_model(assignment_variables, students, courses, model)
+    add_symmetry_breaking_constraints_for_identical_preferences(
+        assignment_variables, students, model
     )
 
-    all_constraints: List[
-        BoundedLinearExpression
-    ] = exactly_one_course_constraints + max_students_per_course_constraints + only_preferred_courses_constraints
-    for constraint in all_constraints:
-        model.Add(constraint)
-
-    # doesn't fit above schema of separating constraint creation and the actual addition to the model
-    # reason: min nr students involves logical or operation, which is tricky to implement in ortools and
-    # needs access to the actual model
-    add_constraints_to_model_min_nr_students(assignment_variables, courses, model)
+    if use_hint:
+        add_preference_hints_to_model(assignment_variables, students, courses, model)
 
     total_cost = generate_cost(students, assignment_variables)
     model.Minimize(total_cost)
 
     solver = cp_model.CpSolver()
+    # let CP-SAT run its parallel portfolio; defaults to one worker per CPU
+    solver.parameters.num_search_workers = (
+        num_search_workers or os.cpu_count() or 8
+    )
+    # students sharing a preference list are interchangeable, so let the
+    # solver look hard for symmetries; full linearization gives tight dual
+    # bounds on the sum-of-preference-ranks objective
+    solver.parameters.symmetry_level = 2
+    solver.parameters.linearization_level = 2
     status = solver.Solve(model)
 
     if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
-        print(f"Minimum of objective function: {solver.ObjectiveValue()}\n")
-        all_assignment_variables: List[IntVar] = assignment_variables.get_all()
-        for assignment in all_assignment_variables:
-            print(f"{assignment} = {solver.Value(assignment)}")
+        print(
+            f"Minimum of objective function: {solver.ObjectiveValue()}"
+            f" (best bound: {solver.BestObjectiveBound()})\n"
+        )
         final_assignment_report: DataFrame = assignment_variables.report_final_assignments(
             solver
         )
@@ -291,10 +494,14 @@ def solve_from_and_to_files(
     student_path: Path,
     solution_path: Path,
     encoding: Union[str, None],
+    num_search_workers: Union[int, None] = None,
+    use_hint: bool = True,
 ) -> None:
     students: StudentPreferences = read_student_preferences_file(student_path, encoding)
     courses: Courses = Courses.make_from_file(capacity_path, encoding)
-    solution: Union[None, DataFrame] = solve(students, courses)
+    solution: Union[None, DataFrame] = solve(
+        students, courses, num_search_workers=num_search_workers, use_hint=use_hint
+    )
     if solution is not None:
         solution.to_csv(solution_path, index=False, encoding=encoding)
         print(f"Saved solution to {solution_path}")
@@ -302,16 +509,36 @@ def solve_from_and_to_files(
 
 
 @click.command()
-@click.argument("capacity_file")
-@click.argument("student_file")
-@click.argument("solution_file")
+@click.argument(
+    "capacity_file", type=click.Path(exists=True, dir_okay=False, path_type=Path)
+)
+@click.argument(
+    "student_file", type=click.Path(exists=True, dir_okay=False, path_type=Path)
+)
+@click.argument("solution_file", type=click.Path(dir_okay=False, path_type=Path))
 @click.option(
     "--encoding",
     help="check here for possible values: https://stackoverflow.com/a/25584253",
     default=None,
 )
+@click.option(
+    "--workers",
+    help="number of parallel solver workers, defaults to the number of CPUs",
+    default=None,
+    type=int,
+)
+@click.option(
+    "--hint/--no-hint",
+    help="hint the solver with everyone's first choice before solving",
+    default=True,
+)
 def solve_from_command_line_args(
-    capacity_file: str, student_file: str, solution_file: str, encoding: str
+    capacity_file: Path,
+    student_file: Path,
+    solution_file: Path,
+    encoding: str,
+    workers: Union[int, None],
+    hint: bool,
 ) -> None:
     """
     Read course capacities from CAPACITY_FILE, read student preferences from STUDENT_FILE,
@@ -323,32 +550,10 @@ def solve_from_command_line_args(
 
     Input files should be CSV files. Output will be written as CSV as well.
     """
-    cap_file: Path = Path(capacity_file)
-    stud_file: Path = Path(student_file)
-    sol_file: Path = Path(solution_file)
-    solve_from_and_to_files(cap_file, stud_file, sol_file, encoding)
-
-
-def add_constraints_to_model_min_nr_students(
-    assignment_variables: CourseAssignmentVariables, courses: Courses, model: CpModel
-) -> None:
-    course_names: list[str] = courses.get_all_course_names()
-    for course_name in course_names:
-        course_min_nr_students: int = courses.get_min_students_by_course_name(
-            course_name
-        )
-        variables_for_course: List[IntVar] = assignment_variables.get_by_course_name(
-            course_name
-        )
-        n_students_assigned_to_course = sum(variables_for_course)
-        either_or: IntVar = model.NewBoolVar(f'either 0 or min_nr_students for {course_name}')
-        enough_students: BoundedLinearExpression = (n_students_assigned_to_course >= course_min_nr_students)
-        no_students: BoundedLinearExpression = (n_students_assigned_to_course == 0)
-        # below is a way to express that EITHER course should have 0 students OR
-        # at least min_nr_students. unhandy to express in ortools, see here for discussion:
-        # https://or.stackexchange.com/questions/4332/how-to-add-logical-or-constraint-in-or-tools
-        model.Add(no_students).OnlyEnforceIf(either_or)
-        model.Add(enough_students).OnlyEnforceIf(either_or.Not())
+    solve_from_and_to_files(
+        capacity_file, student_file, solution_file, encoding,
+        num_search_workers=workers, use_hint=hint,
+    )
 
 
 if __name__ == "__main__":
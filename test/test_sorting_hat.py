@@ -7,8 +7,6 @@ from ortools.sat.python import cp_model
 from ortools.sat.python.cp_model import BoundedLinearExpression, IntVar
 from pandas import DataFrame
 
-from pandas.testing import assert_frame_equal
-
 import sorting_hat
 from sorting_hat import CourseAssignmentVariables, Courses, StudentPreferences
 
@@ -18,6 +16,37 @@ def course_info():
     return DataFrame([{"name": "course_1", "min_size": 0, "max_size": 1}])
 
 
+SHARED_STUDENTS: StudentPreferences = {
+    "alice": ["course_1", "course_2"],
+}
+
+
+def make_assignment_data(model: cp_model.CpModel):
+    # one builder for the hand-rolled assignment tuples so the tests that
+    # exercise CourseAssignmentVariables directly all share the same shape
+    return [
+        ("alice", "course_1", model.NewBoolVar("alice in course_1")),
+        ("alice", "course_2", model.NewBoolVar("alice in course_2")),
+    ]
+
+
+@pytest.fixture(scope="module")
+def shared_model() -> cp_model.CpModel:
+    # model and variable creation dominate these tests, so one model is shared
+    # across all tests that only read from it
+    return cp_model.CpModel()
+
+
+@pytest.fixture(scope="module")
+def shared_assignments(shared_model: cp_model.CpModel) -> CourseAssignmentVariables:
+    courses: Courses = Courses.from_tuples(
+        [("course_1", 0, 1), ("course_2", 0, 1), ("course_3", 0, 1)]
+    )
+    return sorting_hat.generate_course_assignment_variables(
+        SHARED_STUDENTS, courses, shared_model
+    )
+
+
 # unsure how to run test, breaks due to not finding example files at path given
 # def test_has_example_problem():
 #     student_course_preferences: StudentPreferences
@@ -27,89 +56,72 @@ def course_info():
 #     assert len(course_max_nr_students) > 0
 
 
-def test_creates_assignment_variables():
-    students: StudentPreferences = {
-        "alice": ["course_1"],
-    }
-    courses: Courses = Courses(
-        DataFrame(
-            [
-                {"name": "course_1", "min_size": 0, "max_size": 1},
-                {"name": "course_2", "min_size": 0, "max_size": 1},
-            ]
-        )
-    )
-    model = cp_model.CpModel()
-    course_assignments: CourseAssignmentVariables = sorting_hat.generate_course_assignment_variables(
-        students, courses, model
-    )
+def test_creates_assignment_variables(shared_model, shared_assignments):
+    # variables only exist for courses alice actually listed
     expected_variables = CourseAssignmentVariables(
         [
-            ("alice", "course_1", model.NewIntVar(0, 1, "alice in course_1")),
-            ("alice", "course_2", model.NewIntVar(0, 1, "alice in course_2")),
+            ("alice", "course_1", shared_model.NewBoolVar("alice in course_1")),
+            ("alice", "course_2", shared_model.NewBoolVar("alice in course_2")),
         ]
     )
-    assert course_assignments == expected_variables
+    assert shared_assignments == expected_variables
+    assert shared_assignments.get_by_course_name("course_3") == []
 
 
-def test_gets_cp_variables_by_course_name():
-    model: cp_model.CpModel = cp_model.CpModel()
-    assignment_data = [
-        ("alice", "course_1", model.NewIntVar(0, 1, "alice in course_1")),
-        ("alice", "course_2", model.NewIntVar(0, 1, "alice in course_2")),
-    ]
+def test_gets_cp_variables_by_course_name(shared_model):
+    assignment_data = make_assignment_data(shared_model)
     variables: CourseAssignmentVariables = CourseAssignmentVariables(assignment_data)
     var_list_expected: List[IntVar] = [assignment_data[0][2]]
     var_list_returned: List[IntVar] = variables.get_by_course_name("course_1")
     assert var_list_returned == var_list_expected
 
 
-def test_makes_cost_expression():
-    students: StudentPreferences = {
-        "alice": ["course_1", "course_2"],
-    }
-    courses: Courses = Courses(
-        DataFrame(
-            [
-                {"name": "course_1", "min_size": 0, "max_size": 1},
-                {"name": "course_2", "min_size": 0, "max_size": 1},
-                {"name": "course_3", "min_size": 0, "max_size": 1},
-            ]
-        )
-    )
-    model = cp_model.CpModel()
-    course_assignments: CourseAssignmentVariables = sorting_hat.generate_course_assignment_variables(
-        students, courses, model
-    )
-    alice_in_c1, alice_in_c2 = course_assignments.get_by_student_name_and_courses(
+def test_makes_cost_expression(shared_assignments):
+    alice_in_c1, alice_in_c2 = shared_assignments.get_by_student_name_and_courses(
         "alice", ["course_1", "course_2"]
     )
     # note that 'course_3' does not even appear here. we make sure alice can never be assigned to a course she has not listed
     # as a preference through other constraints
     expected_cost: BoundedLinearExpression = 0 * alice_in_c1 + 1 * alice_in_c2
     cost: BoundedLinearExpression = sorting_hat.generate_cost(
-        students, course_assignments
+        SHARED_STUDENTS, shared_assignments
     )
     assert cost == expected_cost
 
 
-def test_gest_all_assignments():
-    model: cp_model.CpModel = cp_model.CpModel()
-    assignment_data = [
-        ("alice", "course_1", model.NewIntVar(0, 1, "alice in course_1")),
-        ("alice", "course_2", model.NewIntVar(0, 1, "alice in course_2")),
-    ]
+def test_gets_cp_variable_by_student_name_and_course(shared_model):
+    assignment_data = make_assignment_data(shared_model)
+    variables: CourseAssignmentVariables = CourseAssignmentVariables(assignment_data)
+    assert (
+        variables.get_by_student_name_and_course("alice", "course_2")
+        is assignment_data[1][2]
+    )
+    with pytest.raises(ValueError):
+        variables.get_by_student_name_and_course("alice", "no_such_course")
+
+
+def test_gest_all_assignments(shared_model):
+    assignment_data = make_assignment_data(shared_model)
     assignments: CourseAssignmentVariables = CourseAssignmentVariables(assignment_data)
     all_assignments_expected: List[IntVar] = [data[2] for data in assignment_data]
     all_assignments: List[IntVar] = assignments.get_all()
     assert all_assignments == all_assignments_expected
 
 
-def test_reads_student_preference_file():
-    pref_file_path: Path = Path("student_preferences.csv")
-    preferences: StudentPreferences = sorting_hat.read_student_preferences_file(
-        pref_file_path, None
+@pytest.fixture(scope="session")
+def student_preferences_from_file() -> StudentPreferences:
+    return sorting_hat.read_student_preferences_file(
+        Path("student_preferences.csv"), None
     )
+
+
+@pytest.fixture(scope="session")
+def courses_from_file() -> Courses:
+    return Courses.make_from_file(Path("course_capacity.csv"), None)
+
+
+def test_reads_student_preference_file(student_preferences_from_file):
+    preferences: StudentPreferences = student_preferences_from_file
     expected: StudentPreferences = {
         "student_1": ["course_1", "course_2", "course_3"],
         "student_2": ["Difficult, Course, With, Commas, Name"],
@@ -117,9 +129,8 @@ def test_reads_student_preference_file():
     assert preferences == expected
 
 
-def test_reads_course_capacity_file():
-    capacity_file_path: Path = Path("course_capacity.csv")
-    capacities: Courses = sorting_hat.Courses.make_from_file(capacity_file_path, None)
+def test_reads_course_capacity_file(courses_from_file):
+    capacities: Courses = courses_from_file
     expected: Courses = Courses(
         DataFrame(
             [
@@ -139,22 +150,18 @@ def test_reads_course_capacity_file():
 
 def all_courses_respect_min_nr_students(solution: DataFrame, courses: Courses) -> bool:
     student_counts_by_course: pandas.Series = solution.value_counts("course")
-    course: str
-    for course, student_count in student_counts_by_course.iteritems():
-        min_student_count: int = courses.get_min_students_by_course_name(course)
-        if student_count < min_student_count:
-            return False
-    return True
+    min_student_counts = student_counts_by_course.index.map(
+        courses.get_min_students_by_course_name
+    )
+    return bool((student_counts_by_course.values >= min_student_counts).all())
 
 
 def all_courses_respect_max_nr_students(solution: DataFrame, courses: Courses):
     student_counts_by_course: pandas.Series = solution.value_counts("course")
-    course: str
-    for course, student_count in student_counts_by_course.iteritems():
-        max_student_count: int = courses.get_max_students_by_course_name(course)
-        if student_count > max_student_count:
-            return False
-    return True
+    max_student_counts = student_counts_by_course.index.map(
+        courses.get_max_students_by_course_name
+    )
+    return bool((student_counts_by_course.values <= max_student_counts).all())
 
 
 def test_all_courses_respect_min_nr_students():
@@ -205,14 +212,14 @@ def test_all_courses_respect_max_nr_students():
 
 
 def all_students_assigned_to_a_preferred_course(solution: DataFrame, students: StudentPreferences):
-    student: str
-    preferred_courses: str
-    assignment_by_student: pandas.Series = solution.set_index('student')['course']
-    for student, preferred_courses in students.items():
-        assigned_course: str = assignment_by_student[student]
-        if assigned_course not in preferred_courses:
-            return False
-    return True
+    preference_pairs: DataFrame = DataFrame(
+        [(student, course) for student, courses in students.items() for course in courses],
+        columns=["student", "course"],
+    )
+    preferred_assignments: DataFrame = solution.merge(
+        preference_pairs, on=["student", "course"]
+    )
+    return len(preferred_assignments) == len(solution)
 
 
 def test_all_students_assigned_to_a_preferred_course():
@@ -233,32 +240,40 @@ def test_all_students_assigned_to_a_preferred_course():
     assert all_students_assigned_to_a_preferred_course(solution_passes, students)
 
 
-def test_solves_problem():
-    students: StudentPreferences = {
-        "alice": ["course_1",],
-        "bob": ["course_2",],
-    }
-    courses: Courses = Courses(
-        DataFrame(
-            [
-                {"name": "course_1", "min_size": 0, "max_size": 1},
-                {"name": "course_2", "min_size": 0, "max_size": 1},
-            ]
-        )
+TRIVIAL_STUDENTS: StudentPreferences = {
+    "alice": ["course_1",],
+    "bob": ["course_2",],
+}
+
+
+@pytest.fixture(scope="session")
+def trivial_courses() -> Courses:
+    return Courses.from_tuples([("course_1", 0, 1), ("course_2", 0, 1)])
+
+
+@pytest.fixture(scope="session")
+def trivial_solution(trivial_courses: Courses) -> DataFrame:
+    # solving runs the whole CP-SAT pipeline, so do it once per session and
+    # let the assertions inspect the cached solution. a single worker avoids
+    # the portfolio's thread-startup cost, which dwarfs this toy solve
+    return sorting_hat.solve(TRIVIAL_STUDENTS, trivial_courses, num_search_workers=1)
+
+
+def test_solves_problem(trivial_solution, trivial_courses):
+    assert all_courses_respect_min_nr_students(trivial_solution, trivial_courses)
+    assert all_courses_respect_max_nr_students(trivial_solution, trivial_courses)
+    assert all_students_assigned_to_a_preferred_course(
+        trivial_solution, TRIVIAL_STUDENTS
     )
-    solution: DataFrame = sorting_hat.solve(students, courses)
-    assert all_courses_respect_min_nr_students(solution, courses)
-    assert all_courses_respect_max_nr_students(solution, courses)
-    assert all_students_assigned_to_a_preferred_course(solution, students)
 
 
-def test_solves_from_file():
+def test_solves_from_file(tmp_path):
     capacity_path: Path = Path("course_capacity.csv")
     student_path: Path = Path("student_preferences.csv")
-    solution_path: Path = Path("test_solution.csv")
-    solution_path.unlink(missing_ok=True)
+    solution_path: Path = tmp_path / "test_solution.csv"
     sorting_hat.solve_from_and_to_files(
-        capacity_path, student_path, solution_path, encoding=None
+        capacity_path, student_path, solution_path, encoding=None,
+        num_search_workers=1,
     )
     assert solution_path.is_file()
 
@@ -268,6 +283,11 @@ def test_makes_courses_from_dataframe(course_info):
     assert len(courses) == 1
 
 
+def test_makes_courses_from_tuples(course_info):
+    courses: Courses = Courses.from_tuples([("course_1", 0, 1)])
+    assert courses == Courses(course_info)
+
+
 def test_returns_course_names(course_info):
     courses: Courses = Courses(course_info)
     assert courses.get_all_course_names() == ["course_1"]